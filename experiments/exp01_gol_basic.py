@@ -3,12 +3,18 @@ import sys
 sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
 from ca.core import CellularAutomaton2D
 from ca.rules import game_of_life_rule
-from ca.viz import grid_to_frame, save_gif, with_trails
+from ca.pipeline import run_pipeline
+from ca.viz import grid_to_frame, with_trails
+
+def trails(grids, decay):
+    # Trails depend on the previous frame, so they stay on the simulation thread.
+    trail = None
+    for grid in grids:
+        trail = with_trails(trail, grid, decay=decay)
+        yield trail
 
 def main():
     out_path = Path("media/week01/intro_gol.gif")
-    frames = []
-    trail = None
 
     ca = CellularAutomaton2D(
         height=256,
@@ -16,39 +22,26 @@ def main():
         rule_fn=game_of_life_rule,
         p_alive=0.22,
         seed=7,
+        block_lut=True,
     )
 
-    def cb(t, grid):
-        nonlocal trail
-        trail = with_trails(trail, grid, decay=0.86)
-        if t % 1 == 0:    # capture every step
-            frames.append(grid_to_frame(trail))
-
-    ca.run(steps=200, callback=cb)
-
-    save_gif(frames, str(out_path), fps=20)
+    # capture every step; .gif frames are encoded on the render pool as they arrive
+    run_pipeline(trails(ca.iterate(200), decay=0.86), grid_to_frame, str(out_path), fps=20)
     print("Saved:", out_path)
 
     # Baseline (no trails)
     out_path2 = Path("media/week01/intro_gol_notrails.gif")
-    frames2 = []
     ca = CellularAutomaton2D(
         height=256,
         width=256,
         rule_fn=game_of_life_rule,
         p_alive=0.22,
         seed=7,
+        block_lut=True,
     )
 
-    def cb2(t, grid):
-        if t % 1 == 0:
-            frames2.append(grid_to_frame(grid))
-
-    ca.run(steps=200, callback=cb2)
-    save_gif(frames2, str(out_path2), fps=20)
+    run_pipeline(ca.iterate(200), grid_to_frame, str(out_path2), fps=20)
     print("Saved:", out_path2)
 
 if __name__ == "__main__":
     main()
-
-
@@ -1,48 +1,26 @@
 import numpy as np
 import imageio
 from pathlib import Path
+import sys
 
-# --- Rule 30 mapping ---
-# Rule 30 binary: 00011110 (LSB first)
-# Neighborhood -> Next state
-RULE_30 = {
-    (1,1,1): 0,
-    (1,1,0): 0,
-    (1,0,1): 0,
-    (1,0,0): 1,
-    (0,1,1): 1,
-    (0,1,0): 1,
-    (0,0,1): 1,
-    (0,0,0): 0,
-}
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
 
+from ca.elementary import evolve_light_cone
 
-def step_rule30(row):
-    new = np.zeros_like(row)
-    N = len(row)
-    for i in range(N):
-        left = row[(i-1) % N]
-        center = row[i]
-        right = row[(i+1) % N]
-        new[i] = RULE_30[(left, center, right)]
-    return new
+# --- Rule 30 ---
+# Rule 30 binary: 00011110 (neighborhoods 111 down to 000)
+RULE = 30
 
 
 def generate_rule30_gif(width=400, steps=1100, window_height=None, window_size=None, fps=30, seed_pos=None, out_path="media/week02/rule30.gif"):
     out_path = Path(out_path)
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Initialize row
-    row = np.zeros(width, dtype=np.uint8)
+    # Precompute timeline (steps x width) from a single white cell,
+    # only updating the light cone until it wraps around
     if seed_pos is None:
         seed_pos = width // 2
-    row[seed_pos] = 1  # single white cell
-
-    # Precompute timeline (steps x width)
-    timeline = np.zeros((steps, width), dtype=np.uint8)
-    for t in range(steps):
-        timeline[t] = row
-        row = step_rule30(row)
+    timeline = evolve_light_cone(RULE, width, steps, seed_pos)
 
     # Resolve window height (default to square crop: width x width)
     if window_size is not None:
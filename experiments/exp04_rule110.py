@@ -1,31 +1,15 @@
 import numpy as np
 import imageio
 from pathlib import Path
+import sys
 
-# --- Rule 110 mapping ---
-# Neighborhood -> Next state
-RULE_110 = {
-    (1, 1, 1): 0,
-    (1, 1, 0): 1,
-    (1, 0, 1): 1,
-    (1, 0, 0): 0,
-    (0, 1, 1): 1,
-    (0, 1, 0): 1,
-    (0, 0, 1): 1,
-    (0, 0, 0): 0,
-}
-
-
-def step_rule110(row: np.ndarray) -> np.ndarray:
-    """Single Rule 110 update step with periodic boundary conditions."""
-    new = np.zeros_like(row)
-    N = len(row)
-    for i in range(N):
-        left = row[(i - 1) % N]
-        center = row[i]
-        right = row[(i + 1) % N]
-        new[i] = RULE_110[(left, center, right)]
-    return new
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+from ca.elementary import evolve_light_cone
+
+# --- Rule 110 ---
+# Rule 110 binary: 01101110 (neighborhoods 111 down to 000)
+RULE = 110
 
 
 def generate_rule110_gif(
@@ -48,17 +32,11 @@ def generate_rule110_gif(
     out_path = Path(out_path)
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Initialize row
-    row = np.zeros(width, dtype=np.uint8)
+    # Precompute timeline (steps x width) from a single white cell,
+    # only updating the light cone until it wraps around
     if seed_pos is None:
         seed_pos = width // 2
-    row[seed_pos] = 1  # single white cell
-
-    # Precompute timeline (steps x width)
-    timeline = np.zeros((steps, width), dtype=np.uint8)
-    for t in range(steps):
-        timeline[t] = row
-        row = step_rule110(row)
+    timeline = evolve_light_cone(RULE, width, steps, seed_pos)
 
     # Resolve window height (default to square crop: width x width)
     if window_size is not None:
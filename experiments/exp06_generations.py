@@ -0,0 +1,40 @@
+from pathlib import Path
+import sys
+import numpy as np
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+from ca.core import CellularAutomaton2D
+from ca.rules import brians_brain_rule, star_wars_rule
+from ca.viz import generations_palette, grid_to_palette_frame, save_gif, upscale_nearest
+
+
+def main():
+    out_path = Path("media/week03/generations.gif")
+
+    height = 128
+    width = 128
+    steps = 200
+
+    ca1 = CellularAutomaton2D(height, width, rule_fn=brians_brain_rule, p_alive=0.2, seed=7)
+    ca2 = CellularAutomaton2D(height, width, rule_fn=star_wars_rule,    p_alive=0.3, seed=7)
+
+    palette1 = generations_palette(ca1.n_states, color=(1.0, 1.0, 1.0), dying=(0.4, 0.9, 1.0))
+    palette2 = generations_palette(ca2.n_states, color=(1.0, 0.9, 0.3), dying=(1.0, 0.3, 0.2))
+
+    frames = []
+
+    for _t in range(steps):
+        f1 = grid_to_palette_frame(ca1.grid, palette1)
+        f2 = grid_to_palette_frame(ca2.grid, palette2)
+        frames.append(upscale_nearest(np.concatenate([f1, f2], axis=1), scale=4))
+
+        ca1.step()
+        ca2.step()
+
+    save_gif(frames, str(out_path), fps=20)
+    print("Saved:", out_path.resolve())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+from pathlib import Path
+import sys
+import imageio
+import numpy as np
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+from ca.elementary import evolve_batch, initial_rows, rule_stats
+from ca.viz import atlas_frame, upscale_nearest
+
+
+def main():
+    out_path = Path("media/week02/rule_atlas.png")
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+
+    width = 151   # not a power of two (additive rules die out on those)
+    steps = 300
+    rules = np.arange(256)
+    seeds = list(range(8))
+
+    # (256 rules x 8 seeds x steps x width) in one batched run
+    rows = initial_rows(seeds, width, p_alive=0.5)
+    timeline = evolve_batch(rules, rows, steps)
+    stats = rule_stats(timeline)
+
+    # Atlas of the last `width` rows for the first seed, 16 rules per row
+    atlas = atlas_frame(timeline[:, 0, -width:], cols=16, pad=2)
+    imageio.imwrite(out_path, upscale_nearest(atlas, scale=2))
+    print(f"Saved: {out_path.resolve()}")
+
+    for c in range(1, 5):
+        members = rules[stats["wolfram_class"] == c]
+        print(f"class {c} ({len(members)}): {' '.join(map(str, members))}")
+
+    print("rule  class  density  compressibility")
+    for r in (30, 54, 90, 110, 184):
+        print(
+            f"{r:>4}  {stats['wolfram_class'][r]:>5}  "
+            f"{stats['density'][r]:>7.3f}  {stats['compressibility'][r]:>15.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
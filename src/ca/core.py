@@ -1,5 +1,7 @@
 import numpy as np
 
+from .blocks import BlockStepper
+
 def count_neighbors(grid: np.ndarray) -> np.ndarray:
     """
     Count 8-neighbors for each cell using wrap-around edges.
@@ -16,18 +18,108 @@ def count_neighbors(grid: np.ndarray) -> np.ndarray:
     )
 
 
+def random_grid(height, width, p_alive=0.2, seed=None, chunk_cells=1 << 22, out=None):
+    """
+    Random 0/1 uint8 grid where each cell is alive with probability p_alive.
+    - random numbers are drawn a band of rows at a time, so the float64
+      temporary is bounded by ~8 * chunk_cells bytes instead of 8 per cell
+    - draws are consumed in row-major order, so the result matches
+      thresholding rng.random((height, width)) in one go, for any chunk size
+    - out: optional preallocated (height, width) uint8 array, filled in place
+    """
+    if out is None:
+        out = np.empty((height, width), dtype=np.uint8)
+    elif out.shape != (height, width) or out.dtype != np.uint8:
+        raise ValueError(f"out must be a ({height}, {width}) uint8 array")
+
+    if p_alive <= 0:
+        out.fill(0)
+        return out
+    if p_alive >= 1:
+        out.fill(1)
+        return out
+
+    rng = np.random.default_rng(seed)
+    rows = max(1, chunk_cells // max(width, 1))
+    buf = np.empty((min(rows, height), width))
+    alive = out.view(np.bool_)
+    for r0 in range(0, height, rows):
+        r1 = min(r0 + rows, height)
+        chunk = buf[: r1 - r0]
+        rng.random(out=chunk)
+        np.less(chunk, p_alive, out=alive[r0:r1])
+    return out
+
+
+def _block_stepper(rule_fn, height, width):
+    if height % 2 or width % 2:
+        raise ValueError(f"block_lut needs even grid dimensions, got ({height}, {width})")
+    return BlockStepper(rule_fn)
+
+
 class CellularAutomaton2D:
-    def __init__(self, height, width, rule_fn, p_alive=0.2, seed=None):
+    def __init__(self, height, width, rule_fn, p_alive=0.2, seed=None, block_lut=False):
         self.height = height
         self.width = width
         self.rule_fn = rule_fn
-        rng = np.random.default_rng(seed)
-        self.grid = (rng.random((height, width)) < p_alive).astype(np.uint8)
+        # Generations rules carry their state count; binary rules don't.
+        self.n_states = getattr(rule_fn, "n_states", 2)
+        # Optional 2x2 block lookup engine (binary rules, even dimensions).
+        self.stepper = _block_stepper(rule_fn, height, width) if block_lut else None
+        self.grid = random_grid(height, width, p_alive, seed)
+
+    @classmethod
+    def from_array(cls, grid, rule_fn, block_lut=False):
+        """
+        Seed from an existing 2D array. uint8 input is used as-is (no copy);
+        step() never writes into the grid in place, so it can be shared.
+        """
+        grid = np.asarray(grid)
+        if grid.ndim != 2:
+            raise ValueError(f"grid must be 2D, got shape {grid.shape}")
+        if grid.dtype != np.uint8:
+            grid = grid.astype(np.uint8)
+        ca = cls.__new__(cls)
+        ca.height, ca.width = grid.shape
+        ca.rule_fn = rule_fn
+        ca.n_states = getattr(rule_fn, "n_states", 2)
+        ca.stepper = _block_stepper(rule_fn, ca.height, ca.width) if block_lut else None
+        ca.grid = grid
+        return ca
 
     def step(self):
-        neighbors = count_neighbors(self.grid)
+        if self.stepper is not None:
+            self.grid = self.stepper.step(self.grid)
+            return
+        if self.n_states > 2:
+            # Only firing cells (state 1) count as live neighbors.
+            neighbors = count_neighbors((self.grid == 1).view(np.uint8))
+        else:
+            neighbors = count_neighbors(self.grid)
         self.grid = self.rule_fn(self.grid, neighbors)
 
+    def advance(self, generations):
+        """
+        Advance several generations without snapshots. With the block engine,
+        generations are taken two at a time.
+        """
+        if self.stepper is not None:
+            for _ in range(generations // 2):
+                self.grid = self.stepper.step2(self.grid)
+            generations %= 2
+        for _ in range(generations):
+            self.step()
+
+    def iterate(self, steps):
+        """
+        Yield the grid at t = 0..steps (same snapshots run() passes to its
+        callback). step() rebinds self.grid, so yielded arrays stay valid.
+        """
+        for _t in range(steps):
+            yield self.grid
+            self.step()
+        yield self.grid
+
     def run(self, steps, callback=None):
         for t in range(steps):
             if callback is not None:
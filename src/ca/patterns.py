@@ -0,0 +1,80 @@
+import re
+
+import numpy as np
+
+_RLE_TOKEN = re.compile(r"(\d*)([a-zA-Z$])")
+
+
+def parse_rle(text):
+    """
+    Parse a Life RLE pattern into a 0/1 uint8 array.
+    - '#' comment lines and the 'x = .., y = ..' header are skipped
+    - 'b' is dead, any other letter is alive, '$' ends a row, '!' ends the pattern
+    """
+    body = []
+    width = height = None
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith("x"):
+            header = dict(
+                part.split("=", 1) for part in line.replace(" ", "").split(",") if "=" in part
+            )
+            width, height = int(header["x"]), int(header["y"])
+            continue
+        body.append(line)
+    body = "".join(body).split("!", 1)[0]
+
+    rows = [[]]
+    for count, tag in _RLE_TOKEN.findall(body):
+        n = int(count) if count else 1
+        if tag == "$":
+            rows.extend([] for _ in range(n))
+        else:
+            rows[-1].extend([0 if tag == "b" else 1] * n)
+
+    if height is None:
+        height = len(rows)
+    if width is None:
+        width = max(len(r) for r in rows)
+    pattern = np.zeros((height, width), dtype=np.uint8)
+    for y, row in enumerate(rows[:height]):
+        pattern[y, : len(row)] = row[:width]
+    return pattern
+
+
+def stamp(grid, pattern, top=0, left=0):
+    """
+    Write pattern into grid in place with its top-left corner at (top, left).
+    Wraps around the edges, matching the toroidal neighbor count.
+    """
+    ph, pw = pattern.shape
+    h, w = grid.shape
+    top %= h
+    left %= w
+    if top + ph <= h and left + pw <= w:
+        grid[top : top + ph, left : left + pw] = pattern
+    else:
+        rows = (top + np.arange(ph)) % h
+        cols = (left + np.arange(pw)) % w
+        grid[np.ix_(rows, cols)] = pattern
+    return grid
+
+
+def tile(pattern, height, width, out=None):
+    """
+    Fill a (height, width) grid by repeating pattern. Works one band of
+    pattern rows at a time, so no full-size temporary is built.
+    - out: optional preallocated uint8 array, filled in place
+    """
+    if out is None:
+        out = np.empty((height, width), dtype=np.uint8)
+    elif out.shape != (height, width) or out.dtype != np.uint8:
+        raise ValueError(f"out must be a ({height}, {width}) uint8 array")
+    ph, pw = pattern.shape
+    band = np.tile(pattern, (1, -(-width // pw)))[:, :width]
+    for r0 in range(0, height, ph):
+        r1 = min(r0 + ph, height)
+        out[r0:r1] = band[: r1 - r0]
+    return out
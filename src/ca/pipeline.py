@@ -0,0 +1,196 @@
+import io
+import itertools
+import os
+import queue
+import struct
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import imageio
+import numpy as np
+from PIL import Image
+
+_DONE = object()
+
+
+def run_pipeline(items, render_fn, out_path, fps=20, workers=None, max_pending=None):
+    """
+    Simulate -> render -> encode as three overlapping stages.
+    - items: iterable of simulation snapshots, consumed on the calling thread
+      (e.g. CellularAutomaton2D.iterate). Snapshots must not be mutated after
+      they are yielded, since rendering happens later on another thread.
+    - render_fn: snapshot -> RGB uint8 frame, run on a pool of `workers` threads
+    - max_pending bounds frames in flight; the simulation blocks once the
+      renderers/encoder fall that far behind
+    Frames always reach out_path in the order the snapshots were produced.
+
+    .gif output is encoded incrementally: each frame is palettized and
+    LZW-compressed on the render pool right after render_fn, and a dedicated
+    encoder thread appends it to the file as it arrives. Any other format
+    goes through imageio's writer on the encoder thread, so it only overlaps
+    if that backend encodes in append_data (e.g. ffmpeg for .mp4); Pillow
+    backed formats still buffer every frame until close.
+    Returns the number of frames rendered. Raises ValueError if items is
+    empty; out_path is never left behind without at least one frame in it.
+    """
+    items = iter(items)
+    first = next(items, _DONE)
+    if first is _DONE:
+        raise ValueError("run_pipeline needs at least one snapshot")
+    items = itertools.chain([first], items)
+
+    os.makedirs(os.path.dirname(out_path), exist_ok=True)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if max_pending is None:
+        max_pending = 2 * workers
+
+    if out_path.lower().endswith(".gif"):
+        task = _render_gif_frame
+        writer = _GifWriter(out_path, fps)
+    else:
+        task = _render_frame
+        writer = imageio.get_writer(out_path, fps=fps)
+
+    # Futures go in in submission order, so the encoder sees frames in order
+    # no matter which worker finishes first.
+    pending = queue.Queue(maxsize=max_pending)
+    errors = []
+
+    def encode():
+        written = 0
+        done = False
+        try:
+            with writer:
+                while True:
+                    future = pending.get()
+                    if future is _DONE:
+                        done = True
+                        break
+                    writer.append_data(future.result())
+                    written += 1
+            if not written:
+                raise ValueError("no frames were written")
+        except BaseException as exc:
+            errors.append(exc)
+            # A writer closed without frames leaves an unreadable file.
+            if not written and os.path.exists(out_path):
+                os.remove(out_path)
+            # Keep draining so the producer never blocks on a dead consumer.
+            while not done and pending.get() is not _DONE:
+                pass
+
+    encoder = threading.Thread(target=encode, name="ca-encoder", daemon=True)
+    encoder.start()
+
+    count = 0
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ca-render") as pool:
+        try:
+            for item in items:
+                if errors:
+                    break
+                pending.put(pool.submit(task, render_fn, item))
+                count += 1
+        finally:
+            pending.put(_DONE)
+            encoder.join()
+
+    if errors:
+        raise errors[0]
+    return count
+
+
+def _render_frame(render_fn, item):
+    return render_fn(item)
+
+
+def _render_gif_frame(render_fn, item):
+    """
+    Render, then encode as a standalone single-frame GIF (same adaptive
+    palette conversion Pillow applies when saving RGB frames) and split it
+    into its pieces, so only cheap byte splicing is left for the encoder.
+    """
+    frame = render_fn(item)
+    buf = io.BytesIO()
+    Image.fromarray(frame).save(buf, format="GIF")
+    return (frame,) + _split_gif(buf.getvalue())
+
+
+def _split_gif(data):
+    """
+    Single-frame GIF bytes -> (width, height, image block), where the image
+    block is the image descriptor with the palette moved into a local color
+    table, followed by the LZW data.
+    """
+    width, height, packed = struct.unpack_from("<HHB", data, 6)
+    pos = 13
+    table = b""
+    if packed & 0x80:
+        table_bits = packed & 0x07
+        table = data[pos : pos + (3 << (table_bits + 1))]
+        pos += len(table)
+
+    # skip extension blocks up to the image descriptor
+    while data[pos] == 0x21:
+        pos += 2
+        while data[pos]:
+            pos += data[pos] + 1
+        pos += 1
+    if data[pos] != 0x2C:
+        raise ValueError("unexpected GIF block layout")
+
+    descriptor = bytearray(data[pos : pos + 10])
+    pos += 10
+    if not descriptor[9] & 0x80:
+        if not table:
+            raise ValueError("GIF frame has no color table")
+        descriptor[9] = (descriptor[9] & 0x78) | 0x80 | table_bits
+        descriptor += table
+
+    # image data runs up to the trailer
+    return width, height, bytes(descriptor) + data[pos:-1]
+
+
+class _GifWriter:
+    """
+    Appends pre-encoded frames to an animated GIF as they arrive.
+    Like Pillow's save_all, identical consecutive frames are merged into one
+    longer frame; no loop extension is written, matching save_gif().
+    """
+
+    def __init__(self, out_path, fps):
+        self.fp = open(out_path, "wb")
+        self.delay = int(1000 / fps / 10)  # centiseconds, as Pillow rounds
+        self.held = None
+        self.held_delay = 0
+
+    def append_data(self, encoded):
+        frame, width, height, block = encoded
+        if self.held is None:
+            self.fp.write(b"GIF89a" + struct.pack("<HHBBB", width, height, 0x70, 0, 0))
+        elif np.array_equal(self.held[0], frame):
+            self.held_delay += self.delay
+            return
+        else:
+            self._flush()
+        self.held = (frame, block)
+        self.held_delay = self.delay
+
+    def _flush(self):
+        # graphic control extension carrying this frame's delay
+        self.fp.write(b"\x21\xf9\x04\x00" + struct.pack("<H", self.held_delay) + b"\x00\x00")
+        self.fp.write(self.held[1])
+
+    def close(self):
+        try:
+            if self.held is not None:
+                self._flush()
+                self.fp.write(b"\x3b")
+        finally:
+            self.fp.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
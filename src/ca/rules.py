@@ -57,3 +57,41 @@ def chaotic_rule(grid, neighbors):
  
      new_grid[survive | born] = 1
      return new_grid
+
+
+def generations_rule(birth, survive, n_states):
+     """
+     Multi-state "Generations" rule B<birth>/S<survive>/C<n_states>.
+       - state 0 is dead, state 1 is alive (firing)
+       - states 2..n_states-1 are refractory and decay one state per step
+       - a firing cell that fails to survive starts decaying
+     Neighbor counts must come from the firing state only.
+
+     The whole transition is folded into one (state, live_neighbors) lookup
+     table, so a step is a single gather instead of a mask per state.
+     """
+     lut = np.zeros((n_states, 9), dtype=np.uint8)
+     lut[0, list(birth)] = 1
+     lut[1, :] = 2 if n_states > 2 else 0
+     lut[1, list(survive)] = 1
+     for state in range(2, n_states):
+          lut[state, :] = (state + 1) % n_states
+     flat_lut = lut.ravel()
+
+     def rule(grid, neighbors):
+          idx = grid.astype(np.uint16)
+          idx *= 9
+          idx += neighbors
+          return flat_lut.take(idx)
+
+     rule.n_states = n_states
+     rule.lut = lut
+     return rule
+
+
+# Brian's Brain: B2/S/C3
+# Every firing cell dies straight away, leaving a one-step refractory trail.
+brians_brain_rule = generations_rule(birth=(2,), survive=(), n_states=3)
+
+# Star Wars: B2/S345/C4
+star_wars_rule = generations_rule(birth=(2,), survive=(3, 4, 5), n_states=4)
@@ -17,12 +17,44 @@ def grid_to_colored_frame(grid, color=(1.0, 1.0, 1.0)):
     rgb = base * np.array(color, dtype=np.float32)[None, None, :]
     return (rgb * 255).astype(np.uint8)
 
+def generations_palette(n_states, color=(1.0, 1.0, 1.0), dying=(0.2, 0.4, 1.0)):
+    """
+    Build an (n_states, 3) uint8 palette for Generations rules.
+    State 0 is black, state 1 (firing) is `color`, refractory states fade
+    from `dying` towards black. Colors are (r,g,b) in 0–1.
+    """
+    palette = np.zeros((n_states, 3), dtype=np.float32)
+    palette[1] = color
+    n_dying = n_states - 2
+    for k in range(n_dying):
+        palette[2 + k] = np.array(dying, dtype=np.float32) * (1.0 - k / n_dying)
+    return (palette * 255).astype(np.uint8)
+
+def grid_to_palette_frame(grid, palette):
+    """
+    Convert multi-state grid -> RGB image by indexing an (n_states, 3) palette.
+    """
+    return np.asarray(palette, dtype=np.uint8).take(grid, axis=0)
+
 def upscale_nearest(frame, scale=4):
     """
     Nearest-neighbor upscale for crisp pixel art visuals.
     """
     return np.repeat(np.repeat(frame, scale, axis=0), scale, axis=1)
 
+def atlas_frame(tiles, cols=16, pad=2, pad_value=64):
+    """
+    Arrange (n, h, w) 0/1 tiles into a grid image with `cols` tiles per row,
+    separated by `pad` pixels of gray. Returns a grayscale RGB image.
+    """
+    n, h, w = tiles.shape
+    rows = -(-n // cols)
+    canvas = np.full((rows * cols, h + pad, w + pad), pad_value, dtype=np.uint8)
+    canvas[:n, :h, :w] = tiles * 255
+    img = canvas.reshape(rows, cols, h + pad, w + pad).transpose(0, 2, 1, 3)
+    img = img.reshape(rows * (h + pad), cols * (w + pad))[: -pad or None, : -pad or None]
+    return np.stack([img, img, img], axis=-1)
+
 def save_gif(frames, out_path, fps=20):
     os.makedirs(os.path.dirname(out_path), exist_ok=True)
     imageio.mimsave(out_path, frames, fps=fps)